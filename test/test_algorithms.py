@@ -15,22 +15,34 @@ from ufl import (
     TestFunction,
     TrialFunction,
     adjoint,
+    as_vector,
+    cos,
     div,
     dot,
     ds,
     dx,
     grad,
     inner,
+    sin,
     triangle,
+    variable,
 )
 from ufl.algorithms import (
+    apply_transformer,
     expand_derivatives,
     expand_indices,
     extract_arguments,
     extract_coefficients,
     extract_elements,
     extract_unique_elements,
+    replace,
+    strip_variables,
+    tree_format,
 )
+from ufl.algorithms.renumbering import renumber_indices
+from ufl.algorithms.transformer import CopyTransformer, ReuseTransformer
+from ufl.core.operator import Operator
+from ufl.core.ufl_type import ufl_type
 from ufl.corealg.traversal import (
     post_traversal,
     pre_traversal,
@@ -38,6 +50,8 @@ from ufl.corealg.traversal import (
     unique_pre_traversal,
 )
 from ufl.finiteelement import FiniteElement
+from ufl.formatting.ufl2unicode import expression2unicode
+from ufl.mathfunctions import Sin
 from ufl.pullback import identity_pullback
 from ufl.sobolevspace import H1
 
@@ -182,3 +196,127 @@ def test_adjoint(domain):
     d = adjoint(b)
     d_arg_degrees = [arg.ufl_element().embedded_superdegree for arg in extract_arguments(d)]
     assert d_arg_degrees == [2, 1]
+
+
+def test_transformer_deep_expression(space):
+    f = Coefficient(space)
+    e = f
+    for _ in range(5000):
+        e = sin(e)
+    # Deeper than the recursion limit, must not raise RecursionError
+    assert strip_variables(variable(e)) is e
+
+
+def test_tree_format_deep_expression(space):
+    f = Coefficient(space)
+    e = f
+    for _ in range(1500):
+        e = sin(e)
+    # Deeper than the recursion limit, must not raise RecursionError
+    lines = tree_format(e).split("\n")
+    assert len(lines) == 1501
+    assert lines[-1].strip() == repr(f)
+
+
+def test_strip_nested_variables(space):
+    f = Coefficient(space)
+    e = f
+    v = f
+    for _ in range(3000):
+        e = sin(e)
+        v = variable(sin(v))
+    # Deeper than the recursion limit, must not raise RecursionError
+    assert strip_variables(v) == e
+
+
+def test_transformer_shared_subexpressions(space):
+    f = Coefficient(space)
+    e = f
+    for _ in range(100):
+        # Tree size doubles with each level, DAG size grows linearly
+        e = sin(e) * cos(e)
+    assert strip_variables(variable(e)) is e
+
+
+def test_transformer_shares_reconstructed_nodes(space):
+    f = Coefficient(space)
+    e = as_vector([sin(f), sin(f)])
+    assert e.ufl_operands[0] is not e.ufl_operands[1]
+    r = apply_transformer(e, CopyTransformer())
+    assert r.ufl_operands[0] is r.ufl_operands[1]
+    assert r == e
+
+
+def test_transformer_reuse(space):
+    f = Coefficient(space)
+    g = Coefficient(space)
+    u = sin(f) + variable(sin(f))
+    v = sin(g) + variable(sin(g))
+    transformer = CopyTransformer()
+    r = apply_transformer(u, transformer)
+    assert r == u
+    assert apply_transformer(v, transformer) == v
+    # Nodes rebuilt in earlier applications are not reused after a reset
+    r2 = apply_transformer(u, transformer)
+    assert r2.ufl_operands[0] is not r.ufl_operands[0]
+    assert r2 == r
+    assert apply_transformer(u, transformer, reset=False) is r2
+
+
+def test_transformer_reset_keeps_variable_cache(space):
+    f = Coefficient(space)
+    e = variable(sin(f))
+    variable_cache = {}
+    transformer = ReuseTransformer(variable_cache=variable_cache)
+    assert apply_transformer(e, transformer) is e
+    assert variable_cache == {e.label(): e}
+    transformer.reset()
+    assert variable_cache == {e.label(): e}
+
+
+def test_replace_identity_mapping(forms, coefficients):
+    f = coefficients[0]
+    for a in forms:
+        assert replace(a, {f: f}) is a
+
+
+def test_replace_shares_across_integrals(space):
+    f = Coefficient(space)
+    g = Coefficient(space)
+    a = replace(sin(f) * dx + sin(f) * ds, {f: g})
+    integrands = [itg.integrand() for itg in a.integrals()]
+    assert len(integrands) == 2
+    assert integrands[0] is integrands[1]
+
+
+def test_late_ufl_type_dispatch(space):
+    f = Coefficient(space)
+    # Build the handler caches before declaring a new UFL type
+    ReuseTransformer()
+    renumber_indices(f)
+
+    @ufl_type(num_ops=1, inherit_shape_from_operand=0, inherit_indices_from_operand=0)
+    class LateOperator(Operator):
+        __slots__ = ()
+
+        def __init__(self, a):
+            Operator.__init__(self, (a,))
+
+        def __str__(self):
+            return f"late({self.ufl_operands[0]})"
+
+    e = LateOperator(sin(f))
+    assert ReuseTransformer().visit(e) is e
+    assert renumber_indices(e) is e
+
+
+def test_late_ufl_type_unicode(space):
+    f = Coefficient(space)
+    # Build the default unicode handlers before declaring a new UFL type
+    expected = expression2unicode(sin(f))
+
+    @ufl_type()
+    class LateSin(Sin):
+        __slots__ = ()
+
+    assert expression2unicode(LateSin(f)) == expected
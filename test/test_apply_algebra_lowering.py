@@ -1,8 +1,27 @@
+import numpy as np
 import pytest
 
-from ufl import Coefficient, FunctionSpace, Index, Mesh, as_tensor, interval, sqrt, triangle
+from ufl import (
+    Coefficient,
+    FunctionSpace,
+    Index,
+    Mesh,
+    as_tensor,
+    interval,
+    sqrt,
+    tetrahedron,
+    triangle,
+)
+from ufl.algebra import Product
 from ufl.algorithms.renumbering import renumber_indices
-from ufl.compound_expressions import cross_expr, determinant_expr, inverse_expr
+from ufl.compound_expressions import (
+    adj_expr,
+    cofactor_expr,
+    cross_expr,
+    determinant_expr,
+    inverse_expr,
+)
+from ufl.corealg.traversal import unique_pre_traversal
 from ufl.finiteelement import FiniteElement
 from ufl.pullback import identity_pullback
 from ufl.sobolevspace import H1
@@ -48,6 +67,16 @@ def A3(request):
     )
 
 
+@pytest.fixture
+def A4(request):
+    return Coefficient(
+        FunctionSpace(
+            Mesh(FiniteElement("Lagrange", tetrahedron, 1, (3,), identity_pullback, H1)),
+            FiniteElement("Lagrange", tetrahedron, 1, (4, 4), identity_pullback, H1),
+        )
+    )
+
+
 @pytest.fixture
 def A21(request):
     return Coefficient(
@@ -98,6 +127,42 @@ def test_determinant3(A3):
     )
 
 
+def test_cofactor3(A3):
+    values = np.array([[4.0, 1.0, -2.0], [1.0, 3.0, 0.0], [-1.0, 2.0, 5.0]])
+    mapping = {A3: lambda x: values}
+    expected = np.linalg.inv(values)
+    C = cofactor_expr(A3)
+    Ainv = inverse_expr(A3)
+    for i in range(3):
+        for j in range(3):
+            assert C[i, j]((0, 0), mapping) == pytest.approx(np.linalg.det(values) * expected[j, i])
+            assert Ainv[i, j]((0, 0), mapping) == pytest.approx(expected[i, j])
+
+
+def test_inverse3_shares_minors(A3):
+    minors = {}
+    Ainv = inverse_expr(A3, minors)
+    # Each of the 9 minors of a 3 by 3 matrix is built once, never also
+    # with its rows swapped
+    assert len(minors) == 9
+    assert len({(min(a, b), max(a, b), c, d) for a, b, c, d in minors}) == 9
+    assert sum(isinstance(o, Product) for o in unique_pre_traversal(Ainv)) == 32
+
+
+def test_cofactor4(A4):
+    values = np.array(
+        [[4.0, 1.0, -2.0, 0.5], [1.0, 3.0, 0.0, 2.0], [-1.0, 2.0, 5.0, 1.0], [0.5, 0.0, 1.0, 6.0]]
+    )
+    mapping = {A4: lambda x: values}
+    expected = np.linalg.det(values) * np.linalg.inv(values)
+    C = cofactor_expr(A4)
+    adj = adj_expr(A4)
+    for i in range(4):
+        for j in range(4):
+            assert C[i, j]((0, 0, 0), mapping) == pytest.approx(expected[j, i])
+            assert adj[i, j]((0, 0, 0), mapping) == pytest.approx(expected[i, j])
+
+
 def test_pseudo_determinant21(A21):
     i = Index()
     assert renumber_indices(determinant_expr(A21)) == renumber_indices(sqrt(A21[i, 0] * A21[i, 0]))
@@ -200,6 +200,23 @@ def test_matrix_from_list(self):
     assert len(D.ufl_shape) == 2
 
 
+def test_list_tensor_properties(self):
+    element = FiniteElement("Lagrange", triangle, 1, (2,), identity_pullback, H1)
+    domain = Mesh(FiniteElement("Lagrange", triangle, 1, (2,), identity_pullback, H1))
+    space = FunctionSpace(domain, element)
+    v = TestFunction(space)
+    u = TrialFunction(space)
+
+    # Properties are stored on the (slotted) ListTensor itself
+    A = as_matrix([[u[i], v[i]], [v[i], u[i]]])
+    assert not hasattr(A, "__dict__")
+    assert A.ufl_shape == (2, 2)
+    assert A.ufl_free_indices == (i.count(),)
+    assert A.ufl_index_dimensions == (2,)
+    assert A[0].ufl_shape == (2,)
+    assert A[0].ufl_free_indices == A.ufl_free_indices
+
+
 def test_tensor(self):
     element = FiniteElement("Lagrange", triangle, 1, (2,), identity_pullback, H1)
     domain = Mesh(FiniteElement("Lagrange", triangle, 1, (2,), identity_pullback, H1))
@@ -91,3 +91,45 @@ def test_lhs_rhs_slightly_obscure():
     F = f * w * dx
     a, L = system(F)
     assert len(L.integrals()) == 1
+
+
+def test_lhs_rhs_long_sum():
+    V = FiniteElement("Lagrange", interval, 1, (), identity_pullback, H1)
+    domain = Mesh(FiniteElement("Lagrange", interval, 1, (1,), identity_pullback, H1))
+    space = FunctionSpace(domain, V)
+    v = TestFunction(space)
+    u = TrialFunction(space)
+    f = Coefficient(space)
+
+    # A long chain of sums
+    integrand = u * v
+    for k in range(1, 600):
+        integrand = integrand + (k * f) * v
+    a, L = system(integrand * dx)
+    assert len(a.integrals()) == 1
+    assert len(L.integrals()) == 1
+
+
+def test_lhs_rhs_shared_subexpressions():
+    V = FiniteElement("Lagrange", interval, 1, (), identity_pullback, H1)
+    domain = Mesh(FiniteElement("Lagrange", interval, 1, (1,), identity_pullback, H1))
+    space = FunctionSpace(domain, V)
+    v = TestFunction(space)
+    u = TrialFunction(space)
+    f = Coefficient(space)
+
+    # Tree size doubles with each level, DAG size grows linearly
+    e = u
+    for _ in range(40):
+        e = e * f + e * 2
+    a, L = system(e * v * dx + f * v * dx)
+    assert len(a.integrals()) == 1
+    assert len(L.integrals()) == 1
+
+    # Shared sums, expanded by PartExtracter.sum itself
+    e = u * f
+    for _ in range(40):
+        e = e + e
+    a, L = system(e * v * dx + f * v * dx)
+    assert len(a.integrals()) == 1
+    assert len(L.integrals()) == 1
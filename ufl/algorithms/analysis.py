@@ -54,7 +54,9 @@ def extract_type(a, ufl_types):
     Returns:
         All objects found in a whose class is in ufl_type
     """
-    if not isinstance(ufl_types, (list, tuple)):
+    if isinstance(ufl_types, list):
+        ufl_types = tuple(ufl_types)
+    elif not isinstance(ufl_types, tuple):
         ufl_types = (ufl_types,)
 
     if all(t is not BaseFormOperator for t in ufl_types):
@@ -81,14 +83,14 @@ def extract_type(a, ufl_types):
             o
             for e in iter_expressions(a)
             for o in traverse_unique_terminals(e)
-            if any(isinstance(o, t) for t in ufl_types)
+            if isinstance(o, ufl_types)
         )
     else:
         objects = set(
             o
             for e in iter_expressions(a)
             for o in unique_pre_traversal(e)
-            if any(isinstance(o, t) for t in ufl_types)
+            if isinstance(o, ufl_types)
         )
 
     # Need to extract objects contained in base form operators whose
@@ -208,9 +210,13 @@ def extract_arguments_and_coefficients(a):
         a: A BaseForm, Integral or Expr
     """
     # Extract lists of all BaseArgument and BaseCoefficient instances
-    base_coeff_and_args = extract_type(a, (BaseArgument, BaseCoefficient))
-    arguments = [f for f in base_coeff_and_args if isinstance(f, BaseArgument)]
-    coefficients = [f for f in base_coeff_and_args if isinstance(f, BaseCoefficient)]
+    arguments = []
+    coefficients = []
+    for f in extract_type(a, (BaseArgument, BaseCoefficient)):
+        if isinstance(f, BaseArgument):
+            arguments.append(f)
+        elif isinstance(f, BaseCoefficient):
+            coefficients.append(f)
 
     # Build number,part: instance mappings, should be one to one
     bfnp = dict((f, (f.number(), f.part())) for f in arguments)
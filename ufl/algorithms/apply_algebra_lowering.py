@@ -8,6 +8,8 @@
 #
 # Modified by Anders Logg, 2009-2010
 
+from collections import defaultdict
+
 from ufl.algorithms.map_integrands import map_integrand_dags
 from ufl.classes import Conj, Grad, Product
 from ufl.compound_expressions import cofactor_expr, determinant_expr, deviatoric_expr, inverse_expr
@@ -22,6 +24,9 @@ class LowerCompoundAlgebra(MultiFunction):
     def __init__(self):
         """Initialize."""
         MultiFunction.__init__(self)
+        # 2x2 minors of each matrix, shared between its determinant,
+        # cofactor and inverse
+        self._minors = defaultdict(dict)
 
     ufl_type = MultiFunction.reuse_if_untouched
 
@@ -93,15 +98,15 @@ class LowerCompoundAlgebra(MultiFunction):
 
     def determinant(self, o, A):
         """Lower a determinant."""
-        return determinant_expr(A)
+        return determinant_expr(A, self._minors[A])
 
     def cofactor(self, o, A):
         """Lower a cofactor."""
-        return cofactor_expr(A)
+        return cofactor_expr(A, self._minors[A])
 
     def inverse(self, o, A):
         """Lower an inverse."""
-        return inverse_expr(A)
+        return inverse_expr(A, self._minors[A])
 
     # ------------ Compound differential operators
 
@@ -11,6 +11,7 @@ of mostly the Jacobian and reference cell data.
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
 import warnings
+from collections import defaultdict
 from functools import reduce
 from itertools import combinations
 
@@ -59,6 +60,9 @@ class GeometryLoweringApplier(MultiFunction):
         self._preserve_types = [False] * Expr._ufl_num_typecodes_
         for cls in preserve_types:
             self._preserve_types[cls._ufl_typecode_] = True
+        # 2x2 minors of each Jacobian, shared between its determinant
+        # and inverse
+        self._minors = defaultdict(dict)
 
     expr = MultiFunction.reuse_if_untouched
 
@@ -100,7 +104,7 @@ class GeometryLoweringApplier(MultiFunction):
         J = self.jacobian(Jacobian(domain))
         # TODO: This could in principle use
         # preserve_types[JacobianDeterminant] with minor refactoring:
-        K = inverse_expr(J)
+        K = inverse_expr(J, self._minors[J])
         return K
 
     @memoized_handler
@@ -111,7 +115,7 @@ class GeometryLoweringApplier(MultiFunction):
 
         domain = extract_unique_domain(o)
         J = self.jacobian(Jacobian(domain))
-        detJ = determinant_expr(J)
+        detJ = determinant_expr(J, self._minors[J])
 
         # TODO: Is "signing" the determinant for manifolds the
         #       cleanest approach?  The alternative is to have a
@@ -144,7 +148,7 @@ class GeometryLoweringApplier(MultiFunction):
         FJ = self.facet_jacobian(FacetJacobian(domain))
         # This could in principle use
         # preserve_types[JacobianDeterminant] with minor refactoring:
-        return inverse_expr(FJ)
+        return inverse_expr(FJ, self._minors[FJ])
 
     @memoized_handler
     def facet_jacobian_determinant(self, o):
@@ -154,7 +158,7 @@ class GeometryLoweringApplier(MultiFunction):
 
         domain = extract_unique_domain(o)
         FJ = self.facet_jacobian(FacetJacobian(domain))
-        detFJ = determinant_expr(FJ)
+        detFJ = determinant_expr(FJ, self._minors[FJ])
 
         # TODO: Should we "sign" the facet jacobian determinant for
         #       manifolds?  It's currently used unsigned in
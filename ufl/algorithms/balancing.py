@@ -30,7 +30,7 @@ modifier_precedence = [
     Indexed,
 ]
 
-modifier_precedence = {m._ufl_handler_name_: i for i, m in enumerate(modifier_precedence)}
+modifier_precedence = {m._ufl_typecode_: i for i, m in enumerate(modifier_precedence)}
 
 
 def balance_modified_terminal(expr):
@@ -54,8 +54,13 @@ def balance_modified_terminal(expr):
     assert layers[-1] is expr
     assert expr._ufl_is_terminal_
 
+    # Preserve id if the modifiers are already in order, innermost first
+    modifiers = layers[-2::-1]
+    layers = sorted(modifiers, key=lambda e: modifier_precedence[e._ufl_typecode_])
+    if all(a is b for a, b in zip(layers, modifiers)):
+        return orig
+
     # Apply modifiers in order
-    layers = sorted(layers[:-1], key=lambda e: modifier_precedence[e._ufl_handler_name_])
     for op in layers:
         ops = (expr,) + op.ufl_operands[1:]
         expr = op._ufl_expr_reconstruct_(*ops)
@@ -67,9 +72,7 @@ def balance_modified_terminal(expr):
 class BalanceModifiers(MultiFunction):
     """Balance modifiers."""
 
-    def expr(self, expr, *ops):
-        """Apply to expr."""
-        return expr._ufl_expr_reconstruct_(*ops)
+    expr = MultiFunction.reuse_if_untouched
 
     def terminal(self, expr):
         """Apply to terminal."""
@@ -12,7 +12,6 @@ These utilities are for expanding free indices in expressions to explicit fixed
 # Modified by Anders Logg, 2009.
 
 from ufl.algorithms.transformer import ReuseTransformer, apply_transformer
-from ufl.classes import Terminal
 from ufl.constantvalue import Zero
 from ufl.core.multiindex import FixedIndex, Index, MultiIndex
 from ufl.differentiation import Grad
@@ -28,6 +27,12 @@ class IndexExpander(ReuseTransformer):
         self._components = Stack()
         self._index2value = StackDict()
 
+    def reset(self):
+        """Clear the state kept from previous transformations."""
+        ReuseTransformer.reset(self)
+        self._components = Stack()
+        self._index2value = StackDict()
+
     def component(self):
         """Return current component tuple."""
         if self._components:
@@ -223,12 +228,17 @@ class IndexExpander(ReuseTransformer):
     def grad(self, x):
         """Apply to grad."""
         (f,) = x.ufl_operands
-        if not isinstance(f, (Terminal, Grad)):
+        if not (f._ufl_is_terminal_ or isinstance(f, Grad)):
             raise ValueError("Expecting expand_derivatives to have been applied.")
         # No need to visit child as long as it is on the form [Grad]([Grad](terminal))
         return x[self.component()]
 
 
-def expand_indices(e):
-    """Expand indices."""
-    return apply_transformer(e, IndexExpander())
+def expand_indices(e, transformer=None):
+    """Expand indices.
+
+    An IndexExpander may be passed to reuse it across calls.
+    """
+    if transformer is None:
+        transformer = IndexExpander()
+    return apply_transformer(e, transformer)
@@ -13,7 +13,7 @@
 import warnings
 from logging import debug
 
-from ufl.algebra import Conj
+from ufl.algebra import Conj, Sum
 
 # Other algorithms:
 from ufl.algorithms.map_integrands import map_integrands
@@ -49,6 +49,10 @@ def zero_expr(e):
 class PartExtracter(Transformer):
     """PartExtracter extracts those parts of a form that contain the given argument(s)."""
 
+    # The parts of a node depend only on the node and the wanted
+    # arguments, so shared subexpressions are visited once
+    _memoize_visits = True
+
     def __init__(self, arguments):
         """Initialise."""
         Transformer.__init__(self)
@@ -118,16 +122,44 @@ class PartExtracter(Transformer):
         arguments -- provide terms that contain the most arguments. If
         there are terms providing different sets of same size -> throw
         error (e.g. Argument(-1) + Argument(-2)).
+
+        Nested sums below x are handled here in a non-recursive
+        post-order traversal, such that long chains of sums do not
+        nest one visit call per term. Their parts are stored in the
+        visit cache, such that a sum shared in the DAG is only
+        expanded once.
         """
+        visit_cache = self._visit_cache
+        results = []
+        lifo = [(x, False)]
+        while lifo:
+            s, expanded = lifo.pop()
+            if expanded:
+                # Both terms of this sum have been visited
+                b = results.pop()
+                a = results.pop()
+                r = self._sum_parts(s, a, b)
+                if visit_cache is not None:
+                    visit_cache[id(s)] = r
+                    self._visited.append(s)
+                results.append(r)
+            elif visit_cache is not None and id(s) in visit_cache:
+                results.append(visit_cache[id(s)])
+            elif isinstance(s, Sum):
+                lifo.append((s, True))
+                lifo.extend((term, False) for term in reversed(s.ufl_operands))
+            else:
+                results.append(self.visit(s))
+        (r,) = results
+        return r
+
+    def _sum_parts(self, x, *visited_terms):
+        """Combine the visited terms of the sum x as described in sum."""
         parts_that_provide = {}
 
         # 1. Skip terms that provide too much
-        original_terms = x.ufl_operands
-        assert len(original_terms) == 2
-        for term in original_terms:
-            # Visit this term in the sum
-            part, term_provides = self.visit(term)
-
+        assert len(visited_terms) == 2
+        for part, term_provides in visited_terms:
             # If this part is zero or it provides more than we want,
             # skip it
             if isinstance(part, Zero) or (term_provides - self._want):
@@ -26,19 +26,12 @@ def map_integrands(function, form, only_integral_type=None):
     to form if it is an Expr.
     """
     if isinstance(form, Form):
-        mapped_integrals = [
-            map_integrands(function, itg, only_integral_type) for itg in form.integrals()
-        ]
-        nonzero_integrals = [
-            itg for itg in mapped_integrals if not isinstance(itg.integrand(), Zero)
-        ]
-        return Form(nonzero_integrals)
+        mapped_integrals = (
+            _map_integral(function, itg, only_integral_type) for itg in form.integrals()
+        )
+        return Form([itg for itg in mapped_integrals if not isinstance(itg.integrand(), Zero)])
     elif isinstance(form, Integral):
-        itg = form
-        if (only_integral_type is None) or (itg.integral_type() in only_integral_type):
-            return itg.reconstruct(function(itg.integrand()))
-        else:
-            return itg
+        return _map_integral(function, form, only_integral_type)
     elif isinstance(form, FormSum):
         mapped_components = [
             map_integrands(function, component, only_integral_type)
@@ -81,8 +74,24 @@ def map_integrands(function, form, only_integral_type=None):
         raise ValueError("Expecting Form, Integral or Expr.")
 
 
+def _map_integral(function, itg, only_integral_type):
+    """Apply function to the integrand of a single integral."""
+    if (only_integral_type is None) or (itg.integral_type() in only_integral_type):
+        return itg.reconstruct(function(itg.integrand()))
+    else:
+        return itg
+
+
 def map_integrand_dags(function, form, only_integral_type=None, compress=True):
-    """Map integrand dags."""
+    """Map integrand dags.
+
+    The caches of map_expr_dag are shared between all integrands, such
+    that subexpressions occurring in several integrals are mapped once.
+    """
+    vcache = {}
+    rcache = {}
     return map_integrands(
-        lambda expr: map_expr_dag(function, expr, compress), form, only_integral_type
+        lambda expr: map_expr_dag(function, expr, compress, vcache=vcache, rcache=rcache),
+        form,
+        only_integral_type,
     )
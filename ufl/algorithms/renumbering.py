@@ -5,7 +5,6 @@
 #
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
-from collections import defaultdict
 from itertools import count as _count
 
 from ufl.algorithms.map_integrands import map_integrand_dags
@@ -19,22 +18,41 @@ class IndexRelabeller(MultiFunction):
     def __init__(self):
         """Initialize index relabeller with a zero count."""
         super().__init__()
-        count = _count()
-        self.index_cache = defaultdict(lambda: Index(next(count)))
+        self._counter = _count()
+        # Relabelled index for each index count
+        self._index_cache = {}
+        self._multi_index_cache = {}
+
+    def relabel(self, count):
+        """Return the relabelled index for the index with the given count."""
+        try:
+            return self._index_cache[count]
+        except KeyError:
+            i = Index(next(self._counter))
+            self._index_cache[count] = i
+            return i
 
     expr = MultiFunction.reuse_if_untouched
 
     def multi_index(self, o):
         """Apply to multi-indices."""
-        return type(o)(
-            tuple(self.index_cache[i] if isinstance(i, Index) else i for i in o.indices())
-        )
+        indices = o.indices()
+        new_indices = tuple(self.relabel(i.count()) if isinstance(i, Index) else i for i in indices)
+        # Reuse o if the indices are already numbered consistently
+        if new_indices == indices:
+            return o
+        # Build one multi-index per relabelled index tuple
+        r = self._multi_index_cache.get(new_indices)
+        if r is None:
+            r = type(o)(new_indices)
+            self._multi_index_cache[new_indices] = r
+        return r
 
     def zero(self, o):
         """Apply to zero."""
         fi = o.ufl_free_indices
         fid = o.ufl_index_dimensions
-        new_indices = [self.index_cache[Index(i)].count() for i in fi]
+        new_indices = [self.relabel(i).count() for i in fi]
         if fi == () and fid == ():
             return o
         new_fi, new_fid = zip(*sorted(zip(new_indices, fid), key=lambda x: x[0]))
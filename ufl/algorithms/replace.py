@@ -24,6 +24,9 @@ class Replacer(MultiFunction):
         """Initialize."""
         super().__init__()
         self.mapping = mapping
+        # Identity keyed view of mapping, to avoid hashing and
+        # comparing expressions when the keys themselves are visited
+        self._mapping_by_id = {id(k): v for k, v in mapping.items()}
 
         # One can replace Coarguments by 1-Forms
         def get_shape(x):
@@ -39,6 +42,9 @@ class Replacer(MultiFunction):
 
     def ufl_type(self, o, *args):
         """Replace a ufl_type."""
+        r = self._mapping_by_id.get(id(o))
+        if r is not None:
+            return r
         try:
             return self.mapping[o]
         except KeyError:
@@ -93,4 +99,8 @@ def replace(e, mapping):
 
         e = expand_derivatives(e)
 
+    # Nothing to replace if every object maps to itself
+    if all(k is v for k, v in mapping2.items()):
+        return e
+
     return map_integrand_dags(Replacer(mapping2), e)
@@ -16,8 +16,9 @@ algorithms.
 import inspect
 
 from ufl.algorithms.map_integrands import map_integrands
-from ufl.classes import Variable, all_ufl_classes
-from ufl.core.ufl_type import UFLType
+from ufl.classes import Variable
+from ufl.core.expr import Expr
+from ufl.corealg.multifunction import get_handler_names
 
 
 def is_post_handler(function):
@@ -37,48 +38,65 @@ class Transformer(object):
 
     _handlers_cache = {}
 
+    # Set to True in subclasses where the result of visiting a node
+    # depends only on the node itself, to transform each node of an
+    # expression DAG only once
+    _memoize_visits = False
+
     def __init__(self, variable_cache=None):
         """Initialise."""
+        # A variable cache passed by the caller is kept across
+        # transformations, one created here is cleared by reset
+        self._own_variable_cache = variable_cache is None
         if variable_cache is None:
             variable_cache = {}
         self._variable_cache = variable_cache
 
+        # Cache of id(o) -> visit(o), with the visited nodes kept alive
+        # in a list so their ids are not reused while cached
+        self._visit_cache = {} if self._memoize_visits else None
+        self._visited = []
+
+        # Cache of reconstructed nodes, such that equal nodes rebuilt
+        # during a transformation share one object
+        self._node_cache = {}
+
         # Analyse class properties and cache handler data the
-        # first time this is run for a particular class
+        # first time this is run for a particular class, or again if
+        # UFL types have been declared since, such that the handler
+        # table covers every typecode
         cache_data = Transformer._handlers_cache.get(type(self))
-        if not cache_data:
-            cache_data = [None] * len(all_ufl_classes)
-            # For all UFL classes
-            for classobject in all_ufl_classes:
-                # Iterate over the inheritance chain
-                # (NB! This assumes that all UFL classes inherits a single
-                # Expr subclass and that this is the first superclass!)
-                for c in classobject.mro():
-                    # Register classobject with handler for the first
-                    # encountered superclass
-                    try:
-                        handler_name = c._ufl_handler_name_
-                    except AttributeError as attribute_error:
-                        if type(classobject) is not UFLType:
-                            raise attribute_error
-                        # Default handler name for UFL types
-                        handler_name = UFLType._ufl_handler_name_
-                    function = getattr(self, handler_name, None)
-                    if function:
-                        cache_data[classobject._ufl_typecode_] = (
-                            handler_name,
-                            is_post_handler(function),
-                        )
-                        break
+        if not cache_data or len(cache_data) != Expr._ufl_num_typecodes_:
+            handler_names = get_handler_names(type(self))
+            is_post = {name: is_post_handler(getattr(self, name)) for name in set(handler_names)}
+            cache_data = [(name, is_post[name]) for name in handler_names]
             Transformer._handlers_cache[type(self)] = cache_data
 
         # Build handler list for this particular class (get functions
-        # bound to self)
-        self._handlers = [(getattr(self, name), post) for (name, post) in cache_data]
+        # bound to self). Many UFL classes share a handler, so bind
+        # each distinct handler name only once.
+        bound = {name: getattr(self, name) for name in {name for (name, post) in cache_data}}
+        self._handlers = [(bound[name], post) for (name, post) in cache_data]
         # Keep a stack of objects visit is called on, to ease
         # backtracking
         self._visit_stack = []
 
+    def reset(self):
+        """Clear the state kept from previous transformations.
+
+        This allows a single transformer to be applied to many
+        expressions without rebuilding its handler table. A transformer
+        instance is not thread safe, use one instance per thread.
+        A variable cache passed to the constructor is left untouched.
+        """
+        if self._own_variable_cache:
+            self._variable_cache.clear()
+        if self._visit_cache is not None:
+            self._visit_cache.clear()
+        self._visited.clear()
+        self._node_cache.clear()
+        self._visit_stack.clear()
+
     def print_visit_stack(self):
         """Print visit stack."""
         print("/" * 80)
@@ -94,26 +112,76 @@ class Transformer(object):
         print("\\" * 80)
 
     def visit(self, o):
-        """Visit."""
-        # Update stack
-        self._visit_stack.append(o)
-
-        # Get handler for the UFL class of o (type(o) may be an
-        # external subclass of the actual UFL class)
-        h, visit_children_first = self._handlers[o._ufl_typecode_]
-
-        # Is this a handler that expects transformed children as
-        # input?
-        if visit_children_first:
-            # Yes, visit all children first and then call h.
-            r = h(o, *[self.visit(op) for op in o.ufl_operands])
-        else:
-            # No, this is a handler that handles its own children
-            # (arguments self and o, where self is already bound)
-            r = h(o)
+        """Visit.
 
-        # Update stack and return
-        self._visit_stack.pop()
+        Handlers expecting transformed children are applied in a
+        non-recursive post-order traversal using an explicit stack,
+        handlers that handle their own children are called directly.
+        """
+        handlers = self._handlers
+        visit_stack = self._visit_stack
+        visit_cache = self._visit_cache
+        keep_alive = self._visited.append
+
+        # Work stack of (node, handler, operands) triples, where handler
+        # and operands are None until the node has been expanded, and
+        # stack of results. Methods used per node are bound to locals
+        # to save attribute lookups in the loop.
+        lifo = [(o, None, None)]
+        results = []
+        pop = lifo.pop
+        push = lifo.append
+        extend = lifo.extend
+        append_result = results.append
+        while lifo:
+            o, h, operands = pop()
+
+            if h is not None:
+                # Children have been visited, collect their results
+                # and call the handler found when o was expanded
+                n = len(operands)
+                if n:
+                    ops = results[-n:]
+                    del results[-n:]
+                    r = h(o, *ops)
+                else:
+                    r = h(o)
+                visit_stack.pop()
+                append_result(r)
+                if visit_cache is not None:
+                    visit_cache[id(o)] = r
+                    keep_alive(o)
+                continue
+
+            # Reuse result if this node has been visited before
+            if visit_cache is not None and id(o) in visit_cache:
+                append_result(visit_cache[id(o)])
+                continue
+
+            # Get handler for the UFL class of o (type(o) may be an
+            # external subclass of the actual UFL class), along with
+            # the precomputed flag telling if it is a post handler
+            h, visit_children_first = handlers[o._ufl_typecode_]
+
+            if visit_children_first:
+                # This is a handler that expects transformed children
+                # as input, visit all children first
+                operands = o.ufl_operands
+                visit_stack.append(o)
+                push((o, h, operands))
+                extend([(op, None, None) for op in reversed(operands)])
+            else:
+                # This is a handler that handles its own children
+                # (arguments self and o, where self is already bound)
+                visit_stack.append(o)
+                r = h(o)
+                visit_stack.pop()
+                append_result(r)
+                if visit_cache is not None:
+                    visit_cache[id(o)] = r
+                    keep_alive(o)
+
+        (r,) = results
         return r
 
     def undefined(self, o):
@@ -130,17 +198,22 @@ class Transformer(object):
         Use in your own subclass by setting e.g. `expr = MultiFunction.reuse_if_untouched`
         as a default rule.
         """
-        if all(a is b for a, b in zip(o.ufl_operands, ops)):
-            return o
-        else:
-            return o._ufl_expr_reconstruct_(*ops)
+        for a, b in zip(o.ufl_operands, ops):
+            if a is not b:
+                return self._reconstruct(o, *ops)
+        return o
 
     # It's just so slow to compare all operands, avoiding it now
     reuse_if_possible = reuse_if_untouched
 
     def always_reconstruct(self, o, *operands):
         """Reconstruct expr."""
-        return o._ufl_expr_reconstruct_(*operands)
+        return self._reconstruct(o, *operands)
+
+    def _reconstruct(self, o, *operands):
+        """Reconstruct expr, reusing an equal node if one has been built before."""
+        r = o._ufl_expr_reconstruct_(*operands)
+        return self._node_cache.setdefault(r, r)
 
     # Set default behaviour for any UFLType
     ufl_type = undefined
@@ -160,8 +233,8 @@ class Transformer(object):
         # Visit the expression our variable represents
         e2 = self.visit(e)
 
-        # If the expression is the same, reuse Variable object
-        if e == e2:
+        # If the expression is the same object, reuse Variable object
+        if e2 is e:
             v = o
         else:
             # Recreate Variable (with same label)
@@ -226,24 +299,36 @@ class CopyTransformer(Transformer):
 class VariableStripper(ReuseTransformer):
     """Variable stripper."""
 
+    _memoize_visits = True
+
     def __init__(self):
         """Initialise."""
         ReuseTransformer.__init__(self)
 
-    def variable(self, o):
+    def variable(self, o, e, l):  # noqa: E741
         """Visit a variable."""
-        return self.visit(o.ufl_operands[0])
+        # Visited as a post handler such that nested variables are
+        # stripped without recursive calls to visit
+        return e
 
 
-def apply_transformer(e, transformer, integral_type=None):
+def apply_transformer(e, transformer, integral_type=None, *, reset=True):
     """Apply transforms.
 
     Apply transformer.visit(expression) to each integrand expression in
-    form, or to form if it is an Expr.
+    form, or to form if it is an Expr. Unless reset is False, the state
+    kept by transformer from previous applications is cleared first.
     """
-    return map_integrands(lambda expr: transformer.visit(expr), e, integral_type)
+    if reset:
+        transformer.reset()
+    return map_integrands(transformer.visit, e, integral_type)
+
 
+def strip_variables(e, transformer=None):
+    """Replace all Variable instances with the expression they represent.
 
-def strip_variables(e):
-    """Replace all Variable instances with the expression they represent."""
-    return apply_transformer(e, VariableStripper())
+    A VariableStripper may be passed to reuse it across calls.
+    """
+    if transformer is None:
+        transformer = VariableStripper()
+    return apply_transformer(e, transformer)
@@ -78,8 +78,12 @@ def pseudo_inverse_expr(A):
         return generic_pseudo_inverse_expr(A)
 
 
-def determinant_expr(A):
-    """Compute the (pseudo-)determinant of A."""
+def determinant_expr(A, minors=None):
+    """Compute the (pseudo-)determinant of A.
+
+    If a dict *minors* is given, the 2 by 2 minors of A are cached in
+    it and shared with other expressions built from the same dict.
+    """
     sh = A.ufl_shape
     if isinstance(A, Zero):
         return zero()
@@ -91,9 +95,9 @@ def determinant_expr(A):
         elif sh[0] == 2:
             return determinant_expr_2x2(A)
         elif sh[0] == 3:
-            return determinant_expr_3x3(A)
+            return determinant_expr_3x3(A, minors)
         else:
-            return determinant_expr_nxn(A)
+            return determinant_expr_nxn(A, minors)
     else:
         return pseudo_determinant_expr(A)
 
@@ -111,33 +115,53 @@ def determinant_expr_2x2(B):
     return _det_2x2(B, 0, 1, 0, 1)
 
 
-def determinant_expr_3x3(A):
+def determinant_expr_3x3(A, minors=None):
     """Determinant of a 3 by 3 matrix."""
-    return codeterminant_expr_nxn(A, [0, 1, 2], [0, 1, 2])
+    return codeterminant_expr_nxn(A, [0, 1, 2], [0, 1, 2], minors)
 
 
-def determinant_expr_nxn(A):
+def determinant_expr_nxn(A, minors=None):
     """Determinant of a n by n matrix."""
     nrow, ncol = A.ufl_shape
     assert nrow == ncol
-    return codeterminant_expr_nxn(A, list(range(nrow)), list(range(ncol)))
+    return codeterminant_expr_nxn(A, list(range(nrow)), list(range(ncol)), minors)
 
 
-def codeterminant_expr_nxn(A, rows, cols):
-    """Determinant of a n by n matrix."""
+def codeterminant_expr_nxn(A, rows, cols, minors=None):
+    """Determinant of a n by n matrix.
+
+    If a dict *minors* is given, the 2 by 2 minors are cached in it
+    and shared between calls.
+    """
     if len(rows) == 2:
-        return _det_2x2(A, rows[0], rows[1], cols[0], cols[1])
+        if minors is None:
+            return _det_2x2(A, rows[0], rows[1], cols[0], cols[1])
+        key = (rows[0], rows[1], cols[0], cols[1])
+        m = minors.get(key)
+        if m is None:
+            # Reuse the same minor with its rows swapped
+            swapped = minors.get((rows[1], rows[0], cols[0], cols[1]))
+            if swapped is not None:
+                return -swapped
+            m = _det_2x2(A, *key)
+            minors[key] = m
+        return m
     codet = 0.0
     r = rows[0]
     subrows = rows[1:]
     for i, c in enumerate(cols):
         subcols = cols[:i] + cols[i + 1 :]
-        codet += (-1) ** i * A[r, c] * codeterminant_expr_nxn(A, subrows, subcols)
+        codet += (-1) ** i * A[r, c] * codeterminant_expr_nxn(A, subrows, subcols, minors)
     return codet
 
 
-def inverse_expr(A):
-    """Compute the inverse of A."""
+def inverse_expr(A, minors=None):
+    """Compute the inverse of A.
+
+    The adjoint and the determinant share the 2 by 2 minors of A,
+    cached in *minors* if given. The determinant is built first, so
+    that the adjoint only folds signs into minors it does not share.
+    """
     sh = A.ufl_shape
     if sh == ():
         return 1.0 / A
@@ -145,12 +169,15 @@ def inverse_expr(A):
         if sh[0] == 1:
             return as_tensor(((1.0 / A[0, 0],),))
         else:
-            return adj_expr(A) / determinant_expr(A)
+            if minors is None:
+                minors = {}
+            det = determinant_expr(A, minors)
+            return adj_expr(A, minors) / det
     else:
         return pseudo_inverse_expr(A)
 
 
-def adj_expr(A):
+def adj_expr(A, minors=None):
     """Adjoint of a matrix."""
     sh = A.ufl_shape
     if sh[0] != sh[1]:
@@ -159,9 +186,9 @@ def adj_expr(A):
     if sh[0] == 2:
         return adj_expr_2x2(A)
     elif sh[0] == 3:
-        return adj_expr_3x3(A)
+        return adj_expr_3x3(A, minors)
     elif sh[0] == 4:
-        return adj_expr_4x4(A)
+        return adj_expr_4x4(A, minors)
 
     raise ValueError(f"adj_expr not implemented for dimension {sh[0]}.")
 
@@ -171,142 +198,17 @@ def adj_expr_2x2(A):
     return as_matrix([[A[1, 1], -A[0, 1]], [-A[1, 0], A[0, 0]]])
 
 
-def adj_expr_3x3(A):
+def adj_expr_3x3(A, minors=None):
     """Adjoint of a 3 by 3 matrix."""
-    return as_matrix(
-        [
-            [
-                A[2, 2] * A[1, 1] - A[1, 2] * A[2, 1],
-                -A[0, 1] * A[2, 2] + A[0, 2] * A[2, 1],
-                A[0, 1] * A[1, 2] - A[0, 2] * A[1, 1],
-            ],
-            [
-                -A[2, 2] * A[1, 0] + A[1, 2] * A[2, 0],
-                -A[0, 2] * A[2, 0] + A[2, 2] * A[0, 0],
-                A[0, 2] * A[1, 0] - A[1, 2] * A[0, 0],
-            ],
-            [
-                A[1, 0] * A[2, 1] - A[2, 0] * A[1, 1],
-                A[0, 1] * A[2, 0] - A[0, 0] * A[2, 1],
-                A[0, 0] * A[1, 1] - A[0, 1] * A[1, 0],
-            ],
-        ]
-    )
+    return _cofactor_expr_nxn(A, minors, transpose=True)
 
 
-def adj_expr_4x4(A):
+def adj_expr_4x4(A, minors=None):
     """Adjoint of a 4 by 4 matrix."""
-    return as_matrix(
-        [
-            [
-                -A[3, 3] * A[2, 1] * A[1, 2]
-                + A[1, 2] * A[3, 1] * A[2, 3]
-                + A[1, 1] * A[3, 3] * A[2, 2]
-                - A[3, 1] * A[2, 2] * A[1, 3]
-                + A[2, 1] * A[1, 3] * A[3, 2]
-                - A[1, 1] * A[3, 2] * A[2, 3],
-                -A[3, 1] * A[0, 2] * A[2, 3]
-                + A[0, 1] * A[3, 2] * A[2, 3]
-                - A[0, 3] * A[2, 1] * A[3, 2]
-                + A[3, 3] * A[2, 1] * A[0, 2]
-                - A[3, 3] * A[0, 1] * A[2, 2]
-                + A[0, 3] * A[3, 1] * A[2, 2],
-                A[3, 1] * A[1, 3] * A[0, 2]
-                + A[1, 1] * A[0, 3] * A[3, 2]
-                - A[0, 3] * A[1, 2] * A[3, 1]
-                - A[0, 1] * A[1, 3] * A[3, 2]
-                + A[3, 3] * A[1, 2] * A[0, 1]
-                - A[1, 1] * A[3, 3] * A[0, 2],
-                A[1, 1] * A[0, 2] * A[2, 3]
-                - A[2, 1] * A[1, 3] * A[0, 2]
-                + A[0, 3] * A[2, 1] * A[1, 2]
-                - A[1, 2] * A[0, 1] * A[2, 3]
-                - A[1, 1] * A[0, 3] * A[2, 2]
-                + A[0, 1] * A[2, 2] * A[1, 3],
-            ],
-            [
-                A[3, 3] * A[1, 2] * A[2, 0]
-                - A[3, 0] * A[1, 2] * A[2, 3]
-                + A[1, 0] * A[3, 2] * A[2, 3]
-                - A[3, 3] * A[1, 0] * A[2, 2]
-                - A[1, 3] * A[3, 2] * A[2, 0]
-                + A[3, 0] * A[2, 2] * A[1, 3],
-                A[0, 3] * A[3, 2] * A[2, 0]
-                - A[0, 3] * A[3, 0] * A[2, 2]
-                + A[3, 3] * A[0, 0] * A[2, 2]
-                + A[3, 0] * A[0, 2] * A[2, 3]
-                - A[0, 0] * A[3, 2] * A[2, 3]
-                - A[3, 3] * A[0, 2] * A[2, 0],
-                -A[3, 3] * A[0, 0] * A[1, 2]
-                + A[0, 0] * A[1, 3] * A[3, 2]
-                - A[3, 0] * A[1, 3] * A[0, 2]
-                + A[3, 3] * A[1, 0] * A[0, 2]
-                + A[0, 3] * A[3, 0] * A[1, 2]
-                - A[0, 3] * A[1, 0] * A[3, 2],
-                A[0, 3] * A[1, 0] * A[2, 2]
-                + A[1, 3] * A[0, 2] * A[2, 0]
-                - A[0, 0] * A[2, 2] * A[1, 3]
-                - A[0, 3] * A[1, 2] * A[2, 0]
-                + A[0, 0] * A[1, 2] * A[2, 3]
-                - A[1, 0] * A[0, 2] * A[2, 3],
-            ],
-            [
-                A[3, 1] * A[1, 3] * A[2, 0]
-                + A[3, 3] * A[2, 1] * A[1, 0]
-                + A[1, 1] * A[3, 0] * A[2, 3]
-                - A[1, 0] * A[3, 1] * A[2, 3]
-                - A[3, 0] * A[2, 1] * A[1, 3]
-                - A[1, 1] * A[3, 3] * A[2, 0],
-                A[3, 3] * A[0, 1] * A[2, 0]
-                - A[3, 3] * A[0, 0] * A[2, 1]
-                - A[0, 3] * A[3, 1] * A[2, 0]
-                - A[3, 0] * A[0, 1] * A[2, 3]
-                + A[0, 0] * A[3, 1] * A[2, 3]
-                + A[0, 3] * A[3, 0] * A[2, 1],
-                -A[0, 0] * A[3, 1] * A[1, 3]
-                + A[0, 3] * A[1, 0] * A[3, 1]
-                - A[3, 3] * A[1, 0] * A[0, 1]
-                + A[1, 1] * A[3, 3] * A[0, 0]
-                - A[1, 1] * A[0, 3] * A[3, 0]
-                + A[3, 0] * A[0, 1] * A[1, 3],
-                A[0, 0] * A[2, 1] * A[1, 3]
-                + A[1, 0] * A[0, 1] * A[2, 3]
-                - A[0, 3] * A[2, 1] * A[1, 0]
-                + A[1, 1] * A[0, 3] * A[2, 0]
-                - A[1, 1] * A[0, 0] * A[2, 3]
-                - A[0, 1] * A[1, 3] * A[2, 0],
-            ],
-            [
-                -A[1, 2] * A[3, 1] * A[2, 0]
-                - A[2, 1] * A[1, 0] * A[3, 2]
-                + A[3, 0] * A[2, 1] * A[1, 2]
-                - A[1, 1] * A[3, 0] * A[2, 2]
-                + A[1, 0] * A[3, 1] * A[2, 2]
-                + A[1, 1] * A[3, 2] * A[2, 0],
-                -A[3, 0] * A[2, 1] * A[0, 2]
-                - A[0, 1] * A[3, 2] * A[2, 0]
-                + A[3, 1] * A[0, 2] * A[2, 0]
-                - A[0, 0] * A[3, 1] * A[2, 2]
-                + A[3, 0] * A[0, 1] * A[2, 2]
-                + A[0, 0] * A[2, 1] * A[3, 2],
-                A[0, 0] * A[1, 2] * A[3, 1]
-                - A[1, 0] * A[3, 1] * A[0, 2]
-                + A[1, 1] * A[3, 0] * A[0, 2]
-                + A[1, 0] * A[0, 1] * A[3, 2]
-                - A[3, 0] * A[1, 2] * A[0, 1]
-                - A[1, 1] * A[0, 0] * A[3, 2],
-                -A[1, 1] * A[0, 2] * A[2, 0]
-                + A[2, 1] * A[1, 0] * A[0, 2]
-                + A[1, 2] * A[0, 1] * A[2, 0]
-                + A[1, 1] * A[0, 0] * A[2, 2]
-                - A[1, 0] * A[0, 1] * A[2, 2]
-                - A[0, 0] * A[2, 1] * A[1, 2],
-            ],
-        ]
-    )
+    return _cofactor_expr_nxn(A, minors, transpose=True)
 
 
-def cofactor_expr(A):
+def cofactor_expr(A, minors=None):
     """Cofactor of a matrix."""
     sh = A.ufl_shape
     if sh[0] != sh[1]:
@@ -315,9 +217,9 @@ def cofactor_expr(A):
     if sh[0] == 2:
         return cofactor_expr_2x2(A)
     elif sh[0] == 3:
-        return cofactor_expr_3x3(A)
+        return cofactor_expr_3x3(A, minors)
     elif sh[0] == 4:
-        return cofactor_expr_4x4(A)
+        return cofactor_expr_4x4(A, minors)
 
     raise ValueError(f"cofactor_expr not implemented for dimension {sh[0]}.")
 
@@ -327,139 +229,40 @@ def cofactor_expr_2x2(A):
     return as_matrix([[A[1, 1], -A[1, 0]], [-A[0, 1], A[0, 0]]])
 
 
-def cofactor_expr_3x3(A):
+def cofactor_expr_3x3(A, minors=None):
     """Cofactor of a 3 by 3 matrix."""
-    return as_matrix(
-        [
-            [
-                A[1, 1] * A[2, 2] - A[2, 1] * A[1, 2],
-                A[2, 0] * A[1, 2] - A[1, 0] * A[2, 2],
-                -A[2, 0] * A[1, 1] + A[1, 0] * A[2, 1],
-            ],
-            [
-                A[2, 1] * A[0, 2] - A[0, 1] * A[2, 2],
-                A[0, 0] * A[2, 2] - A[2, 0] * A[0, 2],
-                -A[0, 0] * A[2, 1] + A[2, 0] * A[0, 1],
-            ],
-            [
-                A[0, 1] * A[1, 2] - A[1, 1] * A[0, 2],
-                A[1, 0] * A[0, 2] - A[0, 0] * A[1, 2],
-                -A[1, 0] * A[0, 1] + A[0, 0] * A[1, 1],
-            ],
-        ]
-    )
+    return _cofactor_expr_nxn(A, minors)
 
 
-def cofactor_expr_4x4(A):
+def cofactor_expr_4x4(A, minors=None):
     """Cofactor of a 4 by 4 matrix."""
-    return as_matrix(
-        [
-            [
-                -A[3, 1] * A[2, 2] * A[1, 3]
-                - A[3, 2] * A[2, 3] * A[1, 1]
-                + A[1, 3] * A[3, 2] * A[2, 1]
-                + A[3, 1] * A[2, 3] * A[1, 2]
-                + A[2, 2] * A[1, 1] * A[3, 3]
-                - A[3, 3] * A[2, 1] * A[1, 2],
-                -A[1, 0] * A[2, 2] * A[3, 3]
-                + A[2, 0] * A[3, 3] * A[1, 2]
-                + A[2, 2] * A[1, 3] * A[3, 0]
-                - A[2, 3] * A[3, 0] * A[1, 2]
-                + A[1, 0] * A[3, 2] * A[2, 3]
-                - A[1, 3] * A[3, 2] * A[2, 0],
-                A[1, 0] * A[3, 3] * A[2, 1]
-                + A[2, 3] * A[1, 1] * A[3, 0]
-                - A[2, 0] * A[1, 1] * A[3, 3]
-                - A[1, 3] * A[3, 0] * A[2, 1]
-                - A[1, 0] * A[3, 1] * A[2, 3]
-                + A[3, 1] * A[1, 3] * A[2, 0],
-                A[3, 0] * A[2, 1] * A[1, 2]
-                + A[1, 0] * A[3, 1] * A[2, 2]
-                + A[3, 2] * A[2, 0] * A[1, 1]
-                - A[2, 2] * A[1, 1] * A[3, 0]
-                - A[3, 1] * A[2, 0] * A[1, 2]
-                - A[1, 0] * A[3, 2] * A[2, 1],
-            ],
-            [
-                A[3, 1] * A[2, 2] * A[0, 3]
-                + A[0, 2] * A[3, 3] * A[2, 1]
-                + A[0, 1] * A[3, 2] * A[2, 3]
-                - A[3, 1] * A[0, 2] * A[2, 3]
-                - A[0, 1] * A[2, 2] * A[3, 3]
-                - A[3, 2] * A[0, 3] * A[2, 1],
-                -A[2, 2] * A[0, 3] * A[3, 0]
-                - A[0, 2] * A[2, 0] * A[3, 3]
-                - A[3, 2] * A[2, 3] * A[0, 0]
-                + A[2, 2] * A[3, 3] * A[0, 0]
-                + A[0, 2] * A[2, 3] * A[3, 0]
-                + A[3, 2] * A[2, 0] * A[0, 3],
-                A[3, 1] * A[2, 3] * A[0, 0]
-                - A[0, 1] * A[2, 3] * A[3, 0]
-                - A[3, 1] * A[2, 0] * A[0, 3]
-                - A[3, 3] * A[0, 0] * A[2, 1]
-                + A[0, 3] * A[3, 0] * A[2, 1]
-                + A[0, 1] * A[2, 0] * A[3, 3],
-                A[3, 2] * A[0, 0] * A[2, 1]
-                - A[0, 2] * A[3, 0] * A[2, 1]
-                + A[0, 1] * A[2, 2] * A[3, 0]
-                + A[3, 1] * A[0, 2] * A[2, 0]
-                - A[0, 1] * A[3, 2] * A[2, 0]
-                - A[3, 1] * A[2, 2] * A[0, 0],
-            ],
-            [
-                A[3, 1] * A[1, 3] * A[0, 2]
-                - A[0, 2] * A[1, 1] * A[3, 3]
-                - A[3, 1] * A[0, 3] * A[1, 2]
-                + A[3, 2] * A[1, 1] * A[0, 3]
-                + A[0, 1] * A[3, 3] * A[1, 2]
-                - A[0, 1] * A[1, 3] * A[3, 2],
-                A[1, 3] * A[3, 2] * A[0, 0]
-                - A[1, 0] * A[3, 2] * A[0, 3]
-                - A[1, 3] * A[0, 2] * A[3, 0]
-                + A[0, 3] * A[3, 0] * A[1, 2]
-                + A[1, 0] * A[0, 2] * A[3, 3]
-                - A[3, 3] * A[0, 0] * A[1, 2],
-                -A[1, 0] * A[0, 1] * A[3, 3]
-                + A[0, 1] * A[1, 3] * A[3, 0]
-                - A[3, 1] * A[1, 3] * A[0, 0]
-                - A[1, 1] * A[0, 3] * A[3, 0]
-                + A[1, 0] * A[3, 1] * A[0, 3]
-                + A[1, 1] * A[3, 3] * A[0, 0],
-                A[0, 2] * A[1, 1] * A[3, 0]
-                - A[3, 2] * A[1, 1] * A[0, 0]
-                - A[0, 1] * A[3, 0] * A[1, 2]
-                - A[1, 0] * A[3, 1] * A[0, 2]
-                + A[3, 1] * A[0, 0] * A[1, 2]
-                + A[1, 0] * A[0, 1] * A[3, 2],
-            ],
-            [
-                A[0, 3] * A[2, 1] * A[1, 2]
-                + A[0, 2] * A[2, 3] * A[1, 1]
-                + A[0, 1] * A[2, 2] * A[1, 3]
-                - A[2, 2] * A[1, 1] * A[0, 3]
-                - A[1, 3] * A[0, 2] * A[2, 1]
-                - A[0, 1] * A[2, 3] * A[1, 2],
-                A[1, 0] * A[2, 2] * A[0, 3]
-                + A[1, 3] * A[0, 2] * A[2, 0]
-                - A[1, 0] * A[0, 2] * A[2, 3]
-                - A[2, 0] * A[0, 3] * A[1, 2]
-                - A[2, 2] * A[1, 3] * A[0, 0]
-                + A[2, 3] * A[0, 0] * A[1, 2],
-                -A[0, 1] * A[1, 3] * A[2, 0]
-                + A[2, 0] * A[1, 1] * A[0, 3]
-                + A[1, 3] * A[0, 0] * A[2, 1]
-                - A[1, 0] * A[0, 3] * A[2, 1]
-                + A[1, 0] * A[0, 1] * A[2, 3]
-                - A[2, 3] * A[1, 1] * A[0, 0],
-                A[1, 0] * A[0, 2] * A[2, 1]
-                - A[0, 2] * A[2, 0] * A[1, 1]
-                + A[0, 1] * A[2, 0] * A[1, 2]
-                + A[2, 2] * A[1, 1] * A[0, 0]
-                - A[1, 0] * A[0, 1] * A[2, 2]
-                - A[0, 0] * A[2, 1] * A[1, 2],
-            ],
-        ]
-    )
+    return _cofactor_expr_nxn(A, minors)
+
+
+def _cofactor_expr_nxn(A, minors=None, transpose=False):
+    """Cofactor (or adjoint if *transpose*) of a n by n matrix.
+
+    Each entry is expanded along the first of its remaining rows, with
+    the 2 by 2 minors of A shared between entries.
+    """
+    n = A.ufl_shape[0]
+    if minors is None:
+        minors = {}
+
+    def c(i, j):
+        rows = [k for k in range(n) if k != i]
+        cols = [k for k in range(n) if k != j]
+        if (i + j) % 2 == 0:
+            return codeterminant_expr_nxn(A, rows, cols, minors)
+        elif n == 3 and tuple(rows + cols) not in minors:
+            # Fold the sign into a new 2 by 2 minor by swapping its rows
+            return codeterminant_expr_nxn(A, rows[::-1], cols, minors)
+        else:
+            return -codeterminant_expr_nxn(A, rows, cols, minors)
+
+    if transpose:
+        return as_matrix([[c(j, i) for j in range(n)] for i in range(n)])
+    return as_matrix([[c(i, j) for j in range(n)] for i in range(n)])
 
 
 def deviatoric_expr(A):
@@ -44,4 +44,4 @@ class Operator(Expr):
     def __repr__(self):
         """Default repr string construction for operators."""
         # This should work for most cases
-        return f"{self._ufl_class_.__name__}({', '.join(repr(op) for op in self.ufl_operands)})"
+        return f"{self._ufl_class_.__name__}({', '.join([repr(op) for op in self.ufl_operands])})"
@@ -70,10 +70,12 @@ def map_expr_dags(function, expressions, compress=True, vcache=None, rcache=None
     # Build mapping typecode:bool, for which types to skip the subtree of
     if isinstance(function, MultiFunction):
         cutoff_types = function._is_cutoff_type
+        reuse_types = function._is_reuse_type
         handlers = function._handlers  # Optimization
     else:
         # Regular function: no skipping supported
         cutoff_types = [False] * Expr._ufl_num_typecodes_
+        reuse_types = cutoff_types
         handlers = [function] * Expr._ufl_num_typecodes_
 
     # Create visited set here to share between traversal calls
@@ -97,22 +99,27 @@ def map_expr_dags(function, expressions, compress=True, vcache=None, rcache=None
                 continue
 
             # Cache miss: Get transformed operands, then apply transformation
-            if cutoff_types[v._ufl_typecode_]:
-                r = handlers[v._ufl_typecode_](v)
+            typecode = v._ufl_typecode_
+            if cutoff_types[typecode]:
+                r = handlers[typecode](v)
+            elif reuse_types[typecode]:
+                # Inlined MultiFunction.reuse_if_untouched
+                r = v
+                for u in v.ufl_operands:
+                    if vcache[u] is not u:
+                        r = v._ufl_expr_reconstruct_(*[vcache[u] for u in v.ufl_operands])
+                        break
             else:
-                r = handlers[v._ufl_typecode_](v, *[vcache[u] for u in v.ufl_operands])
+                r = handlers[typecode](v, *[vcache[u] for u in v.ufl_operands])
 
             # Optionally check if r is in rcache, a memory optimization
-            # to be able to keep representation of result compact
+            # to be able to keep representation of result compact. On
+            # a cache miss r is stored, on a cache hit the previously
+            # computed object is used, allowing r to be garbage
+            # collected as soon as possible. Either way with a single
+            # hash lookup.
             if compress:
-                r2 = rcache.get(r)
-                if r2 is None:
-                    # Cache miss: store in rcache
-                    rcache[r] = r
-                else:
-                    # Cache hit: Use previously computed object r2,
-                    # allowing r to be garbage collected as soon as possible
-                    r = r2
+                r = rcache.setdefault(r, r)
 
             # Store result in cache
             vcache[v] = r
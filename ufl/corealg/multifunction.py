@@ -19,6 +19,41 @@ def get_num_args(function):
     return len(sig.parameters) + 1
 
 
+def get_handler_names(algorithm_class):
+    """Return the handler name used by *algorithm_class* for each UFL type.
+
+    The list is indexed by typecode, and holds the handler name of the
+    first class in the inheritance chain of each type for which the
+    algorithm class has an attribute.
+    """
+    # Names of all attributes defined on the algorithm class, to check
+    # for handlers without attribute lookups
+    attribute_names = set().union(*map(vars, algorithm_class.__mro__))
+
+    handler_names = [None] * Expr._ufl_num_typecodes_
+
+    # Iterate over the inheritance chain for each Expr subclass (NB!
+    # This assumes that all UFL classes inherits from a single Expr
+    # subclass and that the first superclass is always from the UFL
+    # Expr hierarchy!)
+    for classobject in Expr._ufl_all_classes_:
+        for c in classobject.mro():
+            # Register classobject with handler for the first
+            # encountered superclass
+            try:
+                handler_name = c._ufl_handler_name_
+            except AttributeError as attribute_error:
+                if type(classobject) is not UFLType:
+                    raise attribute_error
+                # Default handler name for UFL types
+                handler_name = UFLType._ufl_handler_name_
+
+            if handler_name in attribute_names:
+                handler_names[classobject._ufl_typecode_] = handler_name
+                break
+    return handler_names
+
+
 def memoized_handler(handler):
     """Function decorator to memoize ``MultiFunction`` handlers."""
 
@@ -51,41 +86,28 @@ class MultiFunction(object):
     def __init__(self):
         """Initialise."""
         # Analyse class properties and cache handler data the
-        # first time this is run for a particular class
+        # first time this is run for a particular class, or again if
+        # UFL types have been declared since
         # (cached for each algorithm for performance)
         algorithm_class = type(self)
         cache_data = MultiFunction._handlers_cache.get(algorithm_class)
-        if not cache_data:
-            handler_names = [None] * len(Expr._ufl_all_classes_)
-
-            # Iterate over the inheritance chain for each Expr
-            # subclass (NB! This assumes that all UFL classes inherits
-            # from a single Expr subclass and that the first
-            # superclass is always from the UFL Expr hierarchy!)
-            for classobject in Expr._ufl_all_classes_:
-                for c in classobject.mro():
-                    # Register classobject with handler for the first
-                    # encountered superclass
-                    try:
-                        handler_name = c._ufl_handler_name_
-                    except AttributeError as attribute_error:
-                        if type(classobject) is not UFLType:
-                            raise attribute_error
-                        # Default handler name for UFL types
-                        handler_name = UFLType._ufl_handler_name_
-
-                    if hasattr(self, handler_name):
-                        handler_names[classobject._ufl_typecode_] = handler_name
-                        break
+        if not cache_data or len(cache_data[0]) != Expr._ufl_num_typecodes_:
+            handler_names = get_handler_names(algorithm_class)
             is_cutoff_type = [get_num_args(getattr(self, name)) == 2 for name in handler_names]
-            cache_data = (handler_names, is_cutoff_type)
+            is_reuse_type = [
+                getattr(algorithm_class, name) is MultiFunction.reuse_if_untouched
+                for name in handler_names
+            ]
+            cache_data = (handler_names, is_cutoff_type, is_reuse_type)
             MultiFunction._handlers_cache[algorithm_class] = cache_data
 
         # Build handler list for this particular class (get functions
         # bound to self, these cannot be cached)
-        handler_names, is_cutoff_type = cache_data
+        handler_names, is_cutoff_type, is_reuse_type = cache_data
         self._handlers = [getattr(self, name) for name in handler_names]
         self._is_cutoff_type = is_cutoff_type
+        # Types handled by reuse_if_untouched, which map_expr_dag inlines
+        self._is_reuse_type = is_reuse_type
 
         # Create cache for memoized_handler
         self._memoized_handler_cache = {}
@@ -108,10 +130,10 @@ class MultiFunction(object):
 
         as a default rule.
         """
-        if all(a is b for a, b in zip(o.ufl_operands, ops)):
-            return o
-        else:
-            return o._ufl_expr_reconstruct_(*ops)
+        for a, b in zip(o.ufl_operands, ops):
+            if a is not b:
+                return o._ufl_expr_reconstruct_(*ops)
+        return o
 
     # Set default behaviour for any UFLType as undefined
     ufl_type = undefined
@@ -85,16 +85,16 @@ def unique_post_traversal(expr, visited=None):
 
     Never visit a node twice.
     """
-    lifo = [(expr, list(expr.ufl_operands))]
+    # Stack of (node, iterator over operands not yet visited)
+    lifo = [(expr, iter(expr.ufl_operands))]
     if visited is None:
         visited = set()
     visited.add(expr)
     while lifo:
         expr, deps = lifo[-1]
-        for i, dep in enumerate(deps):
-            if dep is not None and dep not in visited:
-                lifo.append((dep, list(dep.ufl_operands)))
-                deps[i] = None
+        for dep in deps:
+            if dep not in visited:
+                lifo.append((dep, iter(dep.ufl_operands)))
                 break
         else:
             yield expr
@@ -107,25 +107,29 @@ def cutoff_unique_post_traversal(expr, cutofftypes, visited=None):
 
     Never visit a node twice.
     """
-    lifo = [(expr, list(reversed(expr.ufl_operands)))]
     if visited is None:
         visited = set()
+    if cutofftypes[expr._ufl_typecode_]:
+        yield expr
+        visited.add(expr)
+        return
+    # Stack of (node, iterator over operands not yet visited), where
+    # nodes of cutoff types are yielded directly instead of pushed
+    lifo = [(expr, reversed(expr.ufl_operands))]
     while lifo:
         expr, deps = lifo[-1]
-        if cutofftypes[expr._ufl_typecode_]:
+        for dep in deps:
+            if dep not in visited:
+                if cutofftypes[dep._ufl_typecode_]:
+                    yield dep
+                    visited.add(dep)
+                else:
+                    lifo.append((dep, reversed(dep.ufl_operands)))
+                    break
+        else:
             yield expr
             visited.add(expr)
             lifo.pop()
-        else:
-            for i, dep in enumerate(deps):
-                if dep is not None and dep not in visited:
-                    lifo.append((dep, list(reversed(dep.ufl_operands))))
-                    deps[i] = None
-                    break
-            else:
-                yield expr
-                visited.add(expr)
-                lifo.pop()
 
 
 def traverse_terminals(expr):
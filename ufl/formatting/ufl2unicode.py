@@ -4,6 +4,7 @@ import numbers
 
 import ufl
 from ufl.algorithms import compute_form_data
+from ufl.core.expr import Expr
 from ufl.core.multiindex import FixedIndex, Index
 from ufl.corealg.map_dag import map_expr_dag
 from ufl.corealg.multifunction import MultiFunction
@@ -358,7 +359,10 @@ def ufl2unicode(expression):
 
 def expression2unicode(expression, argument_names=None, coefficient_names=None):
     """Generate Unicode string for a UFL expression."""
-    rules = Expression2UnicodeHandler(argument_names, coefficient_names)
+    if argument_names is None and coefficient_names is None:
+        rules = _get_default_rules()
+    else:
+        rules = Expression2UnicodeHandler(argument_names, coefficient_names)
     return map_expr_dag(rules, expression)
 
 
@@ -828,3 +832,15 @@ class Expression2UnicodeHandler(MultiFunction):
     def expr(self, o):
         """Format an expr."""
         raise ValueError(f"Missing handler for type {type(o)}")
+
+
+# The handlers are stateless, so the default ones are built only once
+_default_rules = None
+
+
+def _get_default_rules():
+    """Get the default handlers, rebuilt if UFL types have been declared since."""
+    global _default_rules
+    if _default_rules is None or len(_default_rules._handlers) != Expr._ufl_num_typecodes_:
+        _default_rules = Expression2UnicodeHandler()
+    return _default_rules
@@ -18,41 +18,50 @@ from ufl.indexed import Indexed
 # --- Classes representing tensors of UFL expressions ---
 
 
-@ufl_type(is_shaping=True, num_ops="varying", inherit_indices_from_operand=0)
+@ufl_type(is_shaping=True, num_ops="varying")
 class ListTensor(Operator):
     """Wraps a list of expressions into a tensor valued expression of one higher rank."""
 
-    __slots__ = ()
+    __slots__ = ("ufl_free_indices", "ufl_index_dimensions", "ufl_shape")
 
     def __new__(cls, *expressions):
         """Create a new ListTensor."""
         # All lists and tuples should already be unwrapped in
         # as_tensor
-        if any(not isinstance(e, Expr) for e in expressions):
+        e0 = expressions[0]
+        if not isinstance(e0, Expr):
             raise ValueError("Expecting only UFL expressions in ListTensor constructor.")
 
         # Get properties of the first expression
-        e0 = expressions[0]
         sh = e0.ufl_shape
         fi = e0.ufl_free_indices
         fid = e0.ufl_index_dimensions
 
-        # Obviously, each subexpression must have the same shape
-        if any(sh != e.ufl_shape for e in expressions[1:]):
-            raise ValueError(
-                "Cannot create a tensor by joining subexpressions with different shapes."
-            )
-        if any(fi != e.ufl_free_indices for e in expressions[1:]):
-            raise ValueError(
-                "Cannot create a tensor where the components have different free indices."
-            )
-        if any(fid != e.ufl_index_dimensions for e in expressions[1:]):
-            raise ValueError(
-                "Cannot create a tensor where the components have different free index dimensions."
-            )
+        # Check all subexpressions against the first in a single pass.
+        # Obviously, each subexpression must have the same shape, and
+        # the same free indices, which are kept sorted such that
+        # comparing the tuples also covers the sets of free indices
+        all_zero = isinstance(e0, Zero)
+        for e in expressions[1:]:
+            if not isinstance(e, Expr):
+                raise ValueError("Expecting only UFL expressions in ListTensor constructor.")
+            if sh != e.ufl_shape:
+                raise ValueError(
+                    "Cannot create a tensor by joining subexpressions with different shapes."
+                )
+            if fi != e.ufl_free_indices:
+                raise ValueError(
+                    "Cannot create a tensor where the components have different free indices."
+                )
+            if fid != e.ufl_index_dimensions:
+                raise ValueError(
+                    "Cannot create a tensor where the components have different "
+                    "free index dimensions."
+                )
+            all_zero = all_zero and isinstance(e, Zero)
 
         # Simplify to Zero if possible
-        if all(isinstance(e, Zero) for e in expressions):
+        if all_zero:
             shape = (len(expressions),) + sh
             return Zero(shape, fi, fid)
 
@@ -62,17 +71,12 @@ class ListTensor(Operator):
         """Initialise."""
         Operator.__init__(self, expressions)
 
-        # Checks
-        indexset = set(self.ufl_operands[0].ufl_free_indices)
-        if not all(not (indexset ^ set(e.ufl_free_indices)) for e in self.ufl_operands):
-            raise ValueError(
-                "Can't combine subtensor expressions with different sets of free indices."
-            )
-
-    @property
-    def ufl_shape(self):
-        """Get the UFL shape."""
-        return (len(self.ufl_operands),) + self.ufl_operands[0].ufl_shape
+        # Store properties computed from the first expression, which
+        # all expressions have been checked to share in __new__
+        e0 = expressions[0]
+        self.ufl_shape = (len(expressions),) + e0.ufl_shape
+        self.ufl_free_indices = e0.ufl_free_indices
+        self.ufl_index_dimensions = e0.ufl_index_dimensions
 
     def evaluate(self, x, mapping, component, index_values, derivatives=()):
         """Evaluate."""
@@ -105,23 +109,28 @@ class ListTensor(Operator):
 
     def __str__(self):
         """Format as a string."""
+        # Write the pieces of nested tensors to one buffer, instead of
+        # copying the string of each subtensor into that of its parent
+        buf = []
 
         def substring(expressions, indent):
             ind = " " * indent
             if any(isinstance(e, ListTensor) for e in expressions):
-                substrings = []
-                for e in expressions:
+                buf.append("%s[\n%s" % (ind, ind))
+                for k, e in enumerate(expressions):
+                    if k:
+                        buf.append(",\n" + ind)
                     if isinstance(e, ListTensor):
-                        substrings.append(substring(e.ufl_operands, indent + 2))
+                        substring(e.ufl_operands, indent + 2)
                     else:
-                        substrings.append(str(e))
-                s = (",\n" + ind).join(substrings)
-                return "%s[\n%s%s\n%s]" % (ind, ind, s, ind)
+                        buf.append(str(e))
+                buf.append("\n%s]" % (ind,))
             else:
-                s = ", ".join(str(e) for e in expressions)
-                return "%s[%s]" % (ind, s)
+                s = ", ".join([str(e) for e in expressions])
+                buf.append("%s[%s]" % (ind, s))
 
-        return substring(self.ufl_operands, 0)
+        substring(self.ufl_operands, 0)
+        return "".join(buf)
 
 
 @ufl_type(is_shaping=True, num_ops="varying")
@@ -152,15 +161,20 @@ class ComponentTensor(Operator):
             raise ValueError("Expecting scalar valued expression.")
         if not isinstance(indices, MultiIndex):
             raise ValueError("Expecting a MultiIndex.")
-        if not all(isinstance(i, Index) for i in indices):
-            raise ValueError(f"Expecting sequence of Index objects, not {indices._ufl_err_str_()}.")
+
+        # Check the indices and collect their counts in one pass
+        counts = []
+        for i in indices.indices():
+            if not isinstance(i, Index):
+                raise ValueError(
+                    f"Expecting sequence of Index objects, not {indices._ufl_err_str_()}."
+                )
+            counts.append(i.count())
 
         Operator.__init__(self, (expression, indices))
 
         fi, fid, sh = remove_indices(
-            expression.ufl_free_indices,
-            expression.ufl_index_dimensions,
-            [ind.count() for ind in indices],
+            expression.ufl_free_indices, expression.ufl_index_dimensions, counts
         )
         self.ufl_free_indices = fi
         self.ufl_index_dimensions = fid
@@ -218,7 +232,10 @@ def numpy2nestedlists(arr):
 def _as_list_tensor(expressions):
     """Convert to a list tensor."""
     if isinstance(expressions, (list, tuple)):
-        expressions = [_as_list_tensor(e) for e in expressions]
+        # Check for nested lists and convert leaves in one pass
+        expressions = [
+            _as_list_tensor(e) if isinstance(e, (list, tuple)) else as_ufl(e) for e in expressions
+        ]
         return ListTensor(*expressions)
     else:
         return as_ufl(expressions)
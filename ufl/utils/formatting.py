@@ -5,7 +5,10 @@
 #
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=None)
 def camel2underscore(name):
     """Convert a CamelCaps string to underscore_syntax."""
     letters = []
@@ -80,21 +83,31 @@ def _indent_string(n):
 
 
 def _tree_format_expression(expression, indentation, parentheses):
-    """Tree format expression."""
-    ind = _indent_string(indentation)
-    if expression._ufl_is_terminal_:
-        s = "%s%s" % (ind, repr(expression))
-    else:
-        sops = [
-            _tree_format_expression(o, indentation + 1, parentheses)
-            for o in expression.ufl_operands
-        ]
-        s = "%s%s\n" % (ind, expression._ufl_class_.__name__)
-        if parentheses and len(sops) > 1:
-            s += "%s(\n" % (ind,)
-        s += "\n".join(sops)
-        if parentheses and len(sops) > 1:
-            s += "\n%s)" % (ind,)
+    """Tree format expression, without using Python recursion."""
+    # Post-order traversal with an explicit stack of (node, indentation,
+    # expanded) entries and a stack of formatted operands
+    lifo = [(expression, indentation, False)]
+    results = []
+    while lifo:
+        expression, indentation, expanded = lifo.pop()
+        ind = _indent_string(indentation)
+        if expression._ufl_is_terminal_:
+            results.append("%s%s" % (ind, repr(expression)))
+        elif not expanded:
+            lifo.append((expression, indentation, True))
+            lifo.extend((o, indentation + 1, False) for o in reversed(expression.ufl_operands))
+        else:
+            n = len(results) - len(expression.ufl_operands)
+            sops = results[n:]
+            del results[n:]
+            s = "%s%s\n" % (ind, expression._ufl_class_.__name__)
+            if parentheses and len(sops) > 1:
+                s += "%s(\n" % (ind,)
+            s += "\n".join(sops)
+            if parentheses and len(sops) > 1:
+                s += "\n%s)" % (ind,)
+            results.append(s)
+    (s,) = results
     return s
 
 
@@ -108,11 +121,9 @@ def tree_format(expression, indentation=0, parentheses=True):
 
     if isinstance(expression, Form):
         form = expression
-        integrals = form.integrals()
-        integral_types = sorted(set(itg.integral_type() for itg in integrals))
-        itgs = []
-        for integral_type in integral_types:
-            itgs += list(form.integrals_by_type(integral_type))
+        # Order integrals by type in a single pass, keeping the order
+        # of integrals within each type
+        itgs = sorted(form.integrals(), key=lambda itg: itg.integral_type())
 
         ind = _indent_string(indentation)
         s += ind + "Form:\n"